@@ -0,0 +1,108 @@
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, TextIO
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class Diagnostics:
+    # Captura evidências de falhas e grava o relatório da execução em uma thread separada.
+
+    logger: logging.Logger  # Logger para registro de eventos
+    folder: str  # Pasta onde as evidências (screenshot e HTML) são gravadas
+    report_file: str  # Arquivo JSONL (append-only) com o resultado de cada transação
+    queue: queue.Queue  # Fila de tarefas consumida pela thread de gravação
+    report: TextIO  # Arquivo do relatório, mantido aberto durante toda a execução
+    worker: threading.Thread  # Thread responsável por comprimir e gravar os arquivos
+    counter: int  # Contador para garantir nomes de arquivo únicos
+    closed: bool  # Indica se a thread de gravação já foi encerrada
+
+    def __init__(self, config: Dict[str, Any], logger: logging.Logger) -> None:
+        settings = config["Settings"].get("Diagnostics", {})
+        self.logger = logger
+        self.folder = settings.get("Folder", "Logs/Diagnostics")
+        self.report_file = settings.get("ReportFile", "Logs/report.jsonl")
+        # Fila limitada: se o disco estiver lento, o processamento aguarda em vez de acumular screenshots na memória.
+        self.queue = queue.Queue(maxsize=settings.get("QueueSize", 100))
+        self.counter = 0
+        self.closed = False
+
+        os.makedirs(self.folder, exist_ok=True)
+        report_dir = os.path.dirname(self.report_file)
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+
+        # O relatório é aberto aqui para que erros de caminho ou permissão apareçam na inicialização.
+        self.report = open(self.report_file, "a", encoding="utf-8")
+
+        self.worker = threading.Thread(target=self._run, name="Diagnostics", daemon=True)
+        self.worker.start()
+
+    def capture(self, driver: WebDriver, transaction: object) -> None:
+        # Coleta screenshot e HTML do driver e delega a compressão e gravação para a thread.
+        # A coleta precisa acontecer aqui, pois o WebDriver não é thread-safe.
+        if self.closed:
+            return
+        try:
+            screenshot = driver.get_screenshot_as_png()
+            page_source = driver.page_source
+        except Exception as e:
+            self.logger.error(f"Erro ao capturar evidências da transação {transaction}: {str(e)}")
+            return
+
+        self.counter += 1
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(transaction))[:50]
+        prefix = f"{datetime.now():%Y%m%d_%H%M%S}_{self.counter:05d}_{name}"
+        self.queue.put(("evidence", prefix, screenshot, page_source))
+
+    def record(self, transaction: object, status: str, duration: float, retries: int = 0,
+               error: Optional[str] = None) -> None:
+        # Enfileira o resultado da transação para ser adicionado ao relatório.
+        if self.closed:
+            return
+        self.queue.put(("report", {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "transaction": str(transaction),
+            "status": status,
+            "duration": round(duration, 3),
+            "retries": retries,
+            "error": error,
+        }))
+
+    def close(self) -> None:
+        # Aguarda a gravação de tudo que está na fila e encerra a thread. Pode ser chamado mais de uma vez.
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.worker.join()
+        self.report.close()
+
+    def _run(self) -> None:
+        # Consome a fila até receber o sinal de encerramento.
+        while True:
+            task = self.queue.get()
+            if task is None:
+                break
+            try:
+                if task[0] == "report":
+                    self.report.write(json.dumps(task[1], ensure_ascii=False) + "\n")
+                    self.report.flush()
+                else:
+                    self._write_evidence(*task[1:])
+            except Exception as e:
+                self.logger.error(f"Erro ao gravar diagnóstico: {str(e)}")
+
+    def _write_evidence(self, prefix: str, screenshot: bytes, page_source: str) -> None:
+        # Grava o screenshot (PNG já é comprimido) e o HTML comprimido com gzip.
+        with open(os.path.join(self.folder, f"{prefix}.png"), "wb") as f:
+            f.write(screenshot)
+        with gzip.open(os.path.join(self.folder, f"{prefix}.html.gz"), "wt", encoding="utf-8") as f:
+            f.write(page_source)
+        self.logger.info(f"Evidências gravadas: {prefix}")
@@ -1,8 +1,11 @@
 import logging
+import time
+from typing import Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from Components.google_page import GooglePage
+from Framework.Diagnostics import Diagnostics
 from Framework.Exceptions import BusinessException
 
 
@@ -11,23 +14,39 @@ class ProcessTransaction:
     driver: WebDriver  # Driver WebDriver para controlar o navegador
     logger: logging.Logger  # Logger para registro de eventos
     google_page: GooglePage  # Página do Google para a automação
+    diagnostics: Optional[Diagnostics]  # Captura de evidências e relatório da execução
 
-    def __init__(self, driver: WebDriver, logger: logging.Logger) -> None:
+    def __init__(self, driver: WebDriver, logger: logging.Logger, diagnostics: Optional[Diagnostics] = None) -> None:
         # Injeção de dependência para a página.
         self.driver = driver
         self.logger = logger
         self.google_page = GooglePage(driver, logger)
+        self.diagnostics = diagnostics
 
-    def execute(self, transaction: object) -> None:
+    def execute(self, transaction: object, retries: int = 0) -> None:
+        start = time.perf_counter()
         try:
             # Executa o processamento da transação com validações e tratamento de exceções.
             self.logger.info(f"Processando transação {transaction}")
             self.google_page.open()
             self.logger.info(f" success {transaction}")
+            self.report(transaction, "Success", time.perf_counter() - start, retries)
 
         except BusinessException as e:
             self.logger.error(f"Erro de negócio na transação {transaction}: {str(e)}")
+            self.report(transaction, "BusinessException", time.perf_counter() - start, retries, str(e))
             raise e  # Relança a exceção para ser tratada em outro nível
 
         except Exception as e:
+            # A duração é medida antes da captura para não incluir o tempo de coleta das evidências.
+            elapsed = time.perf_counter() - start
             self.logger.error(f"Erro inesperado na transação {transaction}: {str(e)}")
+            if self.diagnostics:
+                self.diagnostics.capture(self.driver, transaction)
+            self.report(transaction, "SystemException", elapsed, retries, str(e))
+
+    def report(self, transaction: object, status: str, duration: float, retries: int,
+               error: Optional[str] = None) -> None:
+        # Registra o resultado da transação no relatório, se o diagnóstico estiver habilitado.
+        if self.diagnostics:
+            self.diagnostics.record(transaction, status, duration, retries, error)
@@ -1,3 +1,4 @@
+from Framework.Diagnostics import Diagnostics
 from Framework.EndProcess import EndProcess
 from Framework.Exceptions import BusinessException
 from Framework.Init import Init
@@ -12,22 +13,31 @@ def main():
     config = init.get_config()
     logger = init.get_logger()
 
-    driver = Selenium(logger, config["Settings"]["SeleniumBrowser"]).get_driver()
-
-    process_transaction = ProcessTransaction(driver, logger)
-
-    end_process = EndProcess(driver, logger)
-
-    transactions = InitAllApplications(driver,logger,config).work()
+    # Criado antes do navegador para que um erro de configuração não deixe o driver aberto.
+    diagnostics = Diagnostics(config, logger) if "Diagnostics" in config["Settings"] else None
 
     try:
-        for transaction in transactions:
-            process_transaction.execute(transaction)
-    except BusinessException as e:
-        logger.info(f"{e}")
-    except Exception as e:
-        logger.error(f"excessão de sistema: {e}")
-    end_process.finalize()
+        driver = Selenium(logger, config["Settings"]["SeleniumBrowser"]).get_driver()
+
+        process_transaction = ProcessTransaction(driver, logger, diagnostics)
+
+        end_process = EndProcess(driver, logger)
+
+        try:
+            transactions = InitAllApplications(driver, logger, config).work()
+
+            for transaction in transactions:
+                process_transaction.execute(transaction)
+        except BusinessException as e:
+            logger.info(f"{e}")
+        except Exception as e:
+            logger.error(f"excessão de sistema: {e}")
+        finally:
+            end_process.finalize()
+    finally:
+        # Garante que evidências e linhas do relatório pendentes sejam gravadas mesmo em caso de falha.
+        if diagnostics:
+            diagnostics.close()
 
 
 if __name__ == "__main__":